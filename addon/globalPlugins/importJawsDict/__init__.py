@@ -0,0 +1,291 @@
+# Import Jaws Dictionary (importJawsDict/__init__.py), version 0.X-dev
+# A global plugin which provides a tool to import Jaws speech dictionaries into NVDA's dictionaries.
+# Written by Luke Davis, based on regular expression development performed by Brian Vogel.
+
+#    Copyright (C) 2021 Open Source Systems, Ltd. <newanswertech@gmail.com>
+#
+# This program is free software; you can redistribute it and/or modify it under the terms of the GNU General Public License
+# as published by    the Free Software Foundation; either version 2 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License along with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+
+# Constants
+_TESTING_MODE = True
+
+import html
+import importlib
+import os
+import threading
+import wx
+import gui
+
+import addonHandler
+import globalPluginHandler
+import globalVars
+import ui
+import config
+from logHandler import log
+
+addonHandler.initTranslation()
+
+#: importJawsDict Add-on config database
+config.conf.spec["importJawsDict"] = {
+	"lastPath": 'string(default="")',
+	"lastFile": 'string(default="")',
+}
+
+
+def _lazyImport(name):
+	"""Imports and returns the named module of this package.
+	The dialogs and the parser are only needed if the user starts an import, so they are not loaded at NVDA startup.
+	"""
+	return importlib.import_module("." + name, __package__)
+
+#: The import setup dialog, once it has been built
+_setupDialog = None
+
+def _getSetupImportDialog(parent):
+	"""Builds the import setup dialog the first time it is asked for, and returns that same dialog after that.
+	Reopening the dialog is then just a matter of showing it again.
+	"""
+	global _setupDialog
+	if _setupDialog is None:
+		# Translators: title of the import setup dialog
+		title = _("Setup your Jaws Dictionary Import")
+		_setupDialog = _lazyImport("dialogs").SetupImportDialog(parent=parent, id=wx.ID_ANY, title=title)
+	return _setupDialog
+
+#: A simple exception which is raised if the user cancels a multi step dialog
+class UserCanceled(Exception):
+	pass
+
+class GlobalPlugin(globalPluginHandler.GlobalPlugin):
+
+	#: Constant tuple of the NVDA speech dictionaries
+	NVDA_DICTS = (
+		# Translators: a reference to the NVDA Default speech dictionary
+		_("Default dictionary"),
+		# Translators: a reference to the NVDA Voice-specific speech dictionary
+		_("Voice dictionary"),
+		# Translators: a reference to the NVDA Temporary speech dictionary
+		_("Temporary dictionary")
+	)
+	#: The keys in speechDictHandler.dictionaries of the dictionaries in NVDA_DICTS, in the same order
+	NVDA_DICT_KEYS = ("default", "voice", "temp")
+
+	def __init__(self):
+		"""Initializes the add-on by performing the following tasks:
+		- Checks whether running in secure mode, and stops running if so.
+		- Establishes the entry on the NVDA Tools menu.
+		"""
+		super(GlobalPlugin, self).__init__()
+		# Stop initializing if running in secure mode
+		if globalVars.appArgs.secure:
+			return
+		# Create an entry on the NVDA Tools menu
+		self.toolsMenu = gui.mainFrame.sysTrayIcon.toolsMenu
+		self.toolsMenuItem = self.toolsMenu.Append(
+			wx.ID_ANY, kind=wx.ITEM_NORMAL,
+			# Translators: item in the NVDA Tools menu to open the Jaws dictionary import dialog
+			item=_("Import &Jaws Dictionary..."),
+			# Translators: tooltip for the "Import Jaws Dictionary" Tools menu item
+			helpString=_("Import a Jaws speech dictionary into an NVDA speech dictionary")
+		)
+		gui.mainFrame.sysTrayIcon.Bind(wx.EVT_MENU, self.onMultiStepImport, self.toolsMenuItem)
+
+	def terminate(self):
+		"""Cleans up the dialog(s)."""
+		super(GlobalPlugin, self).terminate()
+		# Check whether running in secure mode, and exit if so
+		if globalVars.appArgs.secure:
+			return
+		try:
+			# Unbind as well as remove, or every plugin reload leaves a stale handler in the tray icon's event table
+			gui.mainFrame.sysTrayIcon.Unbind(wx.EVT_MENU, source=self.toolsMenuItem, handler=self.onMultiStepImport)
+			self.toolsMenu.Remove(self.toolsMenuItem)
+		except (RuntimeError, AttributeError):
+			log.debug("Could not remove the Import Jaws Dictionary menu item.")
+		# Destroy the setup dialog, if one was built, so no stale wx handle outlives the plugin
+		global _setupDialog
+		if _setupDialog is not None:
+			try:
+				_setupDialog.Destroy()
+			except RuntimeError:
+				log.debug("The setup import dialog was already destroyed.")
+			_setupDialog = None
+
+	def onMultiStepImport(self, evt):
+		"""Instantiates and manages the user interaction dialogs."""
+		evt.Skip()  # FixMe: document why this is here
+		# Each of these has the potential to be cancelled by the user, which will raise UserCanceled
+		try:
+			# FixMe: there should be a text dialog here explaining to the user what's about to happn.
+			# Step 1: get the source dictionary
+			path, file = self.askForSource()
+			# Step 2: get the target dictionary
+			#: An int that is an index into self.NVDA_DICTS
+			targetDict = self.askForTarget()
+		except UserCanceled:
+			return
+		# Step 3: read the Jaws dictionary, and put its entries in the target.
+		# Parsing a large dictionary and building its entries takes a while, so it is done off the GUI thread,
+		# to keep NVDA responsive. Only adding the entries to the target and saving it happen on the GUI thread.
+		progress = wx.ProgressDialog(
+			# Translators: the title of the dialog shown while a Jaws dictionary is imported
+			_("Importing Jaws dictionary"),
+			# Translators: the message shown while a Jaws dictionary is being read
+			_("Reading {file}...").format(file=file),
+			maximum=100, parent=gui.mainFrame, style=wx.PD_AUTO_HIDE
+		)
+		threading.Thread(
+			target=self._importWorker, args=(path, file, targetDict, progress),
+			name="importJawsDict", daemon=True
+		).start()
+
+	def _importWorker(self, path, file, targetDict, progress):
+		"""Parses the Jaws dictionary and builds its NVDA entries in a background thread,
+		then hands the result back to the GUI thread.
+		progress is updated through wx.CallAfter, since it may only be touched from the GUI thread.
+		Reading takes the first half of the progress bar, and building the entries most of the second half.
+		The bar is kept short of the end, so it stays up while the entries are saved.
+		"""
+		try:
+			parser = _lazyImport("parser")
+			table = parser.parseJawsDict(
+				os.path.join(path, file),
+				onProgress=lambda percent: wx.CallAfter(progress.Update, percent // 2)
+			)
+			# Translators: the message shown while the NVDA entries for a Jaws dictionary are being built
+			buildMessage = _("Converting the entries of {file}...").format(file=file)
+			wx.CallAfter(progress.Update, 50, buildMessage)
+			entries = parser.buildEntries(
+				# Translators: the comment attached to each entry imported from a Jaws dictionary
+				table, _("Imported from {file}").format(file=file),
+				onProgress=lambda percent: wx.CallAfter(progress.Update, 50 + percent * 49 // 100, buildMessage)
+			)
+		except OSError:
+			log.error("Could not read the Jaws dictionary %s.", file, exc_info=True)
+			wx.CallAfter(progress.Destroy)
+			# Translators: reported when the chosen Jaws dictionary could not be read
+			wx.CallAfter(ui.message, _("Could not read {file}.").format(file=file))
+			return
+		except Exception:
+			# Anything else would kill the thread silently, and leave the progress dialog up for good
+			log.error("Failed to import the Jaws dictionary %s.", file, exc_info=True)
+			wx.CallAfter(progress.Destroy)
+			# Translators: reported when importing a Jaws dictionary fails for a reason other than reading it
+			wx.CallAfter(ui.message, _("Could not import {file}. See the NVDA log for details.").format(file=file))
+			return
+		wx.CallAfter(self._finishImport, table, entries, file, targetDict, progress)
+
+	def _finishImport(self, table, entries, file, targetDict, progress):
+		"""Adds the entries built by _importWorker to the target NVDA dictionary. Runs on the GUI thread.
+		table is the JdfTable they were built from.
+		"""
+		dictionary = self.NVDA_DICTS[targetDict]
+		try:
+			if table.unimportableCount and not self.confirmImportsWithBads(table, file):
+				return
+			# Translators: the message shown while imported entries are added to an NVDA dictionary and saved
+			progress.Update(99, _("Saving the {dictionary}...").format(dictionary=dictionary))
+			_lazyImport("parser").importEntries(entries, self.NVDA_DICT_KEYS[targetDict])
+		except OSError:
+			log.error("Could not save the %s speech dictionary.", self.NVDA_DICT_KEYS[targetDict], exc_info=True)
+			# Translators: reported when the NVDA dictionary could not be saved after an import
+			ui.message(_("Could not save the {dictionary}.").format(dictionary=dictionary))
+			return
+		finally:
+			progress.Destroy()
+		ui.message(
+			# Translators: reported when an import finishes
+			_("Imported {count} entries into the {dictionary}.").format(
+				count=len(entries), dictionary=dictionary
+			)
+		)
+
+	def confirmImportsWithBads(self, entries, file):
+		"""Shows the records of the Jaws dictionary which could not be imported, and asks whether to import the rest.
+		Only the first few are listed, followed by a count of the others.
+		Returns True if the user wants to go ahead.
+		"""
+		prefix = "<p>{}</p>\n<pre>\n".format(html.escape(
+			# Translators: the heading of the list of lines from a Jaws dictionary which could not be imported
+			_("These lines of {file} are not valid Jaws dictionary entries, and will not be imported:").format(file=file)
+		))
+		lines = [html.escape(line) for line in entries.unimportables]
+		more = entries.unimportableCount - len(entries.unimportables)
+		if more:
+			# Translators: ends the list of Jaws dictionary lines which could not be imported, when it was cut short
+			lines.append(html.escape(_("...and {count} more.").format(count=more)))
+		msg = "".join((prefix, "\n".join(lines), "\n</pre>"))
+		# Translators: the title of the window listing the lines of a Jaws dictionary which could not be imported
+		ui.browseableMessage(msg, _("Lines which could not be imported"), isHtml=True)
+		return gui.messageBox(
+			# Translators: asks whether to go on with an import after some lines of the Jaws dictionary could not be read
+			_("{bad} lines of {file} could not be imported. Import the other {good} entries?").format(
+				bad=entries.unimportableCount, file=file, good=len(entries)
+			),
+			# Translators: the title of the dialog asking whether to go on with an import
+			_("Confirm import"),
+			wx.YES_NO | wx.ICON_WARNING
+		) == wx.YES
+
+	def askForSource(self):
+		"""Shows a file chooser dialog asking for a Jaws dictionary.
+		Raises UserCanceled if the user cancels.
+		Returns a tuple containing the path and filename.
+		The chooser opens on the last dictionary chosen, which is remembered in the add-on configuration.
+		"""  # FixMe: proper docstring needed
+		conf = config.conf["importJawsDict"]
+		with wx.FileDialog(
+			gui.mainFrame,
+			# Translators: the title of the Jaws dictionary file selector dialog.
+			_("Step 1: select a Jaws dictionary"),
+			conf["lastPath"], conf["lastFile"],
+			wildcard="Jaws Dictionary Files (*.jdf)|*.jdf|All files (*.*)|*.*",
+			style=wx.FD_OPEN|wx.FD_FILE_MUST_EXIST
+		) as sourceChooser:
+			# Show the dialog and react to cancel
+			if sourceChooser.ShowModal() == wx.ID_CANCEL:
+				raise UserCanceled
+			# Remember the selected path and file for next time, and return them
+			path, file = os.path.split(os.path.normpath(sourceChooser.GetPath()))
+			conf["lastPath"] = path
+			conf["lastFile"] = file
+			return path, file
+
+	def askForTarget(self):
+		"""Shows a dialog with a list of possible NVDA dictionaries for the user to choose from.
+		Raises UserCanceled if the user does.
+		Returns the result (an index into self.NVDA_DICTS).
+		""" # FixMe: needs a real docstring
+		# Ask the user which dictionary to use
+		with wx.SingleChoiceDialog(
+			gui.mainFrame,
+			# Translators: the descriptive message shown to the user, asking
+			# which target NVDA dictionary they wish to use.
+			_(
+				"Step 2: select the target NVDA dictionary where you would like "
+				"the entries from the Jaws dictionary to be placed."
+			),
+			# Translators: the title of the NVDA dictionary selector dialog
+			_("Choose the target dictionary"),
+			self.NVDA_DICTS, wx.OK|wx.CANCEL|wx.CENTRE
+		) as targetChooser:
+		# In production we default to the Default dictionary, but in testing we default to Temporary
+			if _TESTING_MODE:
+				targetChooser.SetSelection(2)
+			else:
+				targetChooser.SetSelection(0)
+			# Show the dialog and react to cancel
+			if targetChooser.ShowModal() == wx.ID_CANCEL:
+				raise UserCanceled
+			return targetChooser.GetSelection()
+
+	def onSetupImportDialog_old(self, evt):
+		"""Instantiates and manages the import setup dialog."""
+		evt.Skip()  # FixMe: document why this is here
+		_getSetupImportDialog(gui.mainFrame).Show()
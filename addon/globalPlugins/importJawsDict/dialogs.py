@@ -0,0 +1,141 @@
+# Import Jaws Dictionary (importJawsDict/dialogs.py), version 0.X-dev
+# The dialogs used by the Import Jaws Dictionary global plugin.
+# Imported on first use, rather than at NVDA startup.
+# Written by Luke Davis, based on regular expression development performed by Brian Vogel.
+
+#    Copyright (C) 2021 Open Source Systems, Ltd. <newanswertech@gmail.com>
+#
+# This program is free software; you can redistribute it and/or modify it under the terms of the GNU General Public License
+# as published by    the Free Software Foundation; either version 2 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License along with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+
+import os
+import wx
+
+import addonHandler
+import config
+import ui
+from logHandler import log
+
+from . import _TESTING_MODE
+
+addonHandler.initTranslation()
+
+# The translated strings of the setup import dialog.
+# Looked up once, when this module is first imported, which is after translation has been initialized.
+#: The NVDA speech dictionaries offered in the setup import dialog.
+_TARGET_CHOICES = (
+	# Translators: a reference to the NVDA Default speech dictionary
+	_("Default"),
+	# Translators: a reference to the NVDA Temporary speech dictionary
+	_("Temporary"),
+	# Translators: a reference to the NVDA Voice-specific speech dictionary
+	_("Voice-specific")
+)
+# Translators: label of an edit field in Setup Import dialog to enter the path of a Jaws dictionary
+_JAWS_PATH_LABEL = _("&Jaws dictionary path:")
+# Translators: label of a button in Setup Import dialog which opens a file chooser for the Jaws dictionary
+_BROWSE_LABEL = _("&Browse...")
+# Translators: the title of the Jaws dictionary file selector dialog opened from the Browse button.
+_BROWSE_TITLE = _("Select a Jaws dictionary")
+#: The index into _TARGET_CHOICES selected when the dialog opens.
+#: In production we default to the Default dictionary, but in testing we default to Temporary.
+_DEFAULT_TARGET_INDEX = 1 if _TESTING_MODE else 0
+
+
+class DictionaryChooserPanel(wx.Panel):
+	"""Generates a wx.Panel containing elements for choosing a Jaws dictionary."""
+
+	def __init__(self, parent=None, id=wx.ID_ANY) -> None:
+		super().__init__(parent, id)
+		sizer = wx.BoxSizer(wx.HORIZONTAL)
+		sizer.Add(wx.StaticText(self, wx.ID_ANY, label=_JAWS_PATH_LABEL))
+		self.jDict = wx.TextCtrl(self, wx.ID_ANY)
+		sizer.Add(self.jDict)
+		self.browse = wx.Button(self, wx.ID_ANY, label=_BROWSE_LABEL)
+		self.browse.Bind(wx.EVT_BUTTON, self.onBrowse)
+		sizer.Add(self.browse)
+		self.SetSizer(sizer)
+		self.refreshFromConfig()
+
+	def refreshFromConfig(self) -> None:
+		"""Offers the last dictionary used, if it is still there.
+		Only that one file is checked; the Jaws settings folders are never scanned.
+		"""
+		lastPath = config.conf["importJawsDict"]["lastPath"]
+		lastFile = config.conf["importJawsDict"]["lastFile"]
+		if lastPath and lastFile and os.path.isfile(os.path.join(lastPath, lastFile)):
+			self.jDict.SetValue(os.path.join(lastPath, lastFile))
+
+	def onBrowse(self, evt) -> None:
+		"""Shows a file chooser for the Jaws dictionary, and puts the chosen path in the edit field.
+		The chooser is only created when the user asks for it, so opening the panel never lists a directory.
+		"""
+		with wx.FileDialog(
+			self,
+			_BROWSE_TITLE,
+			defaultDir=os.path.dirname(self.jDict.GetValue()),
+			wildcard="Jaws Dictionary Files (*.jdf)|*.jdf|All files (*.*)|*.*",
+			style=wx.FD_OPEN | wx.FD_FILE_MUST_EXIST
+		) as chooser:
+			if chooser.ShowModal() == wx.ID_OK:
+				self.jDict.SetValue(chooser.GetPath())
+
+
+class SetupImportDialog(wx.Dialog):
+	"""Creates and populates the import setup dialog."""
+
+	def __init__(self, parent, id: int, title: str) -> None:
+		super().__init__(parent, id, title=title)
+		self.mainSizer = wx.BoxSizer(wx.VERTICAL)
+		# NVDA speech dictionary selector
+		self.targetDict = wx.RadioBox(self, wx.ID_ANY, choices=_TARGET_CHOICES, style=wx.RA_VERTICAL)
+		self.targetDict.SetSelection(_DEFAULT_TARGET_INDEX)
+		# File chooser
+		self.container = wx.Panel(parent=self)
+		self.panel = DictionaryChooserPanel(parent=self.container)
+		# Setup the buttons
+		buttons = self.CreateSeparatedButtonSizer(wx.OK | wx.CANCEL | wx.HELP)
+		# Build the dialog
+		self.mainSizer.Add(self.container)
+		self.mainSizer.Add(self.targetDict)
+		self.mainSizer.Add(buttons, flag=wx.BOTTOM)
+		self.mainSizer.Fit(self)
+		self.SetSizer(self.mainSizer)
+		self.Center(wx.BOTH | wx.CENTER)
+		# Button configuration: one handler on the dialog, dispatching on the button ID.
+		# Buttons without an entry here, such as Cancel, get their default behaviour.
+		self._buttonHandlers = {
+			wx.ID_OK: self.onOk,
+			wx.ID_HELP: self.onHelp,
+		}
+		self.Bind(wx.EVT_BUTTON, self._onButton)
+		# The dialog is built once and reshown, so the remembered dictionary may have changed since it was built
+		self.Bind(wx.EVT_SHOW, self._onShow)
+
+	def _onShow(self, evt) -> None:
+		"""Refreshes the Jaws dictionary path from the configuration each time the dialog is shown."""
+		if evt.IsShown():
+			self.panel.refreshFromConfig()
+		evt.Skip()
+
+	def _onButton(self, evt) -> None:
+		"""Passes a button press to the handler for that button, if there is one."""
+		handler = self._buttonHandlers.get(evt.GetId())
+		if handler is None:
+			evt.Skip()
+		else:
+			handler(evt)
+
+	def onHelp(self, evt) -> None:
+		"""Shows a dialog with a help message to the user."""
+		ui.message("Not yet implemented. Try again later.")
+		log.warning("Unimplemented help button pressed in SetupImportDialog.")
+
+	def onOk(self, evt) -> None:
+		ui.message("It would have been okay, had this been implemented.")
+		log.warning("Unimplemented OK button pressed in SetupImportDialog.")
@@ -0,0 +1,251 @@
+# Import Jaws Dictionary (importJawsDict/parser.py), version 0.X-dev
+# Reads Jaws speech dictionaries, and converts their records into NVDA speech dictionary entries.
+# Imported on first use, rather than at NVDA startup.
+# Written by Luke Davis, based on regular expression development performed by Brian Vogel.
+
+#    Copyright (C) 2021 Open Source Systems, Ltd. <newanswertech@gmail.com>
+#
+# This program is free software; you can redistribute it and/or modify it under the terms of the GNU General Public License
+# as published by    the Free Software Foundation; either version 2 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License along with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+
+import codecs
+import mmap
+import os
+import re
+import string
+
+import speechDictHandler
+from logHandler import log
+
+#: The encoding Jaws uses when it writes dictionary files
+_JDF_ENCODING = "cp1252"
+#: The decoder for _JDF_ENCODING, looked up once.
+#: Decoding by encoding name looks the codec up again on every call, which was most of the cost of parsing a record.
+_decodeJdf = codecs.getdecoder(_JDF_ENCODING)
+#: The decoder for dictionaries which start with a UTF-8 byte order mark, as some editors write them
+_decodeUtf8 = codecs.getdecoder("utf-8")
+#: The byte values which may start a Jaws dictionary record, and separate its fields
+_JDF_SEPARATORS = frozenset(string.punctuation.encode("ascii"))
+#: The length of the shortest possible record: eight separators, a one character actual word, and the case flag
+_JDF_MIN_RECORD_LENGTH = 10
+#: Matches the Jaws <sound .../> tags which may appear in a replacement. NVDA can't play them, so they are removed.
+#: Compiled once, since it is applied per record.
+_SOUND_TAG_RE = re.compile(rb"<sound +[^>]*?/>", re.IGNORECASE)
+#: The number of lines parsed between progress reports
+_PROGRESS_INTERVAL = 4096
+#: The most unimportable records whose text is kept; any more are only counted
+_MAX_UNIMPORTABLES = 50
+#: Returned by _tokenizeJdfLine for a line which is laid out as a record, but is not a valid one
+_MALFORMED_RECORD = object()
+
+# Jaws pattern translation
+# This is built once at import; do not move into hot loop.
+#: Maps each character of a Jaws actual word which means something to regular expressions to its regular expression form.
+#: Metacharacters are escaped, and the Jaws wildcards are translated.
+#: Jaws matches whole words, so its wildcards stand for word characters only.
+_JAWS_TO_RE_TABLE = str.maketrans({
+	**{char: "\\" + char for char in "\\.^$+(){}[]|"},
+	"?": r"\w",
+	"*": r"\w*",
+})
+
+
+def _tokenizeJdfLine(line, decode=_decodeJdf):
+	"""Splits one line of a Jaws dictionary (.jdf) file into its fields.
+	A record is seven fields, each one opened and closed by the same separator character, which is
+	whatever punctuation character the line starts with. E.g.: .actual.replacement.*.*.*.*.0.
+	The fields are: actual word, replacement, language, synthesizer, voice, voice language, case sensitivity.
+	line is raw bytes; only the actual word and replacement are decoded, with decode.
+	Returns a tuple of (actual word, replacement, language, case sensitive), where the language is left as bytes.
+	Returns _MALFORMED_RECORD if the line starts and ends with the same separator, but is not a valid record,
+	or None if the line is not a record at all.
+	"""
+	line = line.rstrip()
+	# Reject blank lines, comments, and other junk with cheap checks before splitting:
+	# a record is long enough to hold all its separators, and starts and ends with the same punctuation character.
+	if len(line) < _JDF_MIN_RECORD_LENGTH or line[0] not in _JDF_SEPARATORS or line[-1] != line[0]:
+		return None
+	# A record starts and ends with the separator, so a good one splits into seven fields plus two empty strings
+	fields = line.split(line[:1])
+	if len(fields) != 9:
+		return _MALFORMED_RECORD
+	start, inWord, outWord, lang, synth, voice, voiceLang, case, end = fields
+	# An actual word of nothing but wildcards would become a pattern matching every word NVDA speaks
+	if not inWord.strip(b"*?") or case not in (b"0", b"1"):
+		return _MALFORMED_RECORD
+	# Hardly any replacements contain a tag, so only run the pattern when there might be one
+	if b"<" in outWord:
+		# A tag is replaced by a space, so the words on either side of it are not run together
+		scrubbed, tags = _SOUND_TAG_RE.subn(b" ", outWord)
+		if tags:
+			outWord = b" ".join(scrubbed.split())
+			# A replacement which was only a sound would otherwise become an entry deleting the word
+			if not outWord:
+				return _MALFORMED_RECORD
+	return (
+		decode(inWord, "replace")[0],
+		decode(outWord, "replace")[0],
+		lang,
+		case == b"1"
+	)
+
+class JdfTable:
+	"""The records read from a Jaws dictionary, held as parallel columns rather than as an object per record.
+	Row i is the actual word inWords[i], its replacement outWords[i], and its case sensitivity caseSensitive[i].
+	Only the fields needed to build NVDA entries are kept.
+	"""
+
+	__slots__ = (
+		"inWords", "outWords", "caseSensitive", "duplicates", "unimportables", "unimportableCount", "junkCount",
+		"lineCount", "recordCount", "_rows", "_langs"
+	)
+
+	def __init__(self):
+		self.inWords = []
+		self.outWords = []
+		#: One byte per row: 1 if the entry is case sensitive, 0 if not
+		self.caseSensitive = bytearray()
+		#: The number of records which replaced an earlier one
+		self.duplicates = 0
+		#: The decoded text of the first few lines which are laid out like records, but are not valid ones
+		self.unimportables = []
+		#: The number of such lines, including those beyond the ones kept in unimportables
+		self.unimportableCount = 0
+		#: The number of other non-blank lines which are not records, such as comments
+		self.junkCount = 0
+		#: The number of lines read, and how many of them were valid records, duplicates included
+		self.lineCount = 0
+		self.recordCount = 0
+		#: Maps (actual word, language) to its row, so a repeated actual word replaces the earlier one
+		self._rows = {}
+		#: Pools the language codes, so equal languages share one object.
+		#: They are only used to tell records apart, so they are kept as the undecoded bytes.
+		self._langs = {}
+
+	def __len__(self):
+		return len(self.inWords)
+
+	def add(self, inWord, outWord, lang, caseSensitive):
+		"""Adds a record to the table, or replaces the earlier record for the same actual word and language."""
+		# A dictionary uses only a handful of languages, so every record shares one object per language.
+		# Actual words are nearly all distinct, so pooling them would cost more than it saves.
+		key = (inWord, self._langs.setdefault(lang, lang))
+		row = self._rows.get(key)
+		if row is None:
+			self._rows[key] = len(self.inWords)
+			self.inWords.append(inWord)
+			self.outWords.append(outWord)
+			self.caseSensitive.append(caseSensitive)
+		else:
+			self.duplicates += 1
+			self.outWords[row] = outWord
+			self.caseSensitive[row] = caseSensitive
+
+def parseJawsDict(path, onProgress=None):
+	"""Reads the Jaws dictionary at path, and returns its records as a JdfTable.
+	Lines which are not valid records are skipped.
+	Those which start and end with the same separator, so were meant as records, are counted in unimportableCount,
+	and the first few are kept in unimportables. Other non-blank lines, such as comments, are only counted in junkCount.
+	If an actual word is given more than once for the same language, the last one wins.
+	The file is read as cp1252, as Jaws writes it, unless it starts with a UTF-8 byte order mark.
+	If given, onProgress is called every few thousand lines with the percentage of the file read so far.
+	"""
+	table = JdfTable()
+	# The file is memory mapped and read as bytes, rather than read into a buffer and decoded whole.
+	# The OS page cache serves the lines, and only the fields which are kept are ever decoded.
+	with open(path, "rb") as jdf:
+		size = os.fstat(jdf.fileno()).st_size
+		# An empty file can't be mapped, and has no entries anyway
+		if not size:
+			return table
+		with mmap.mmap(jdf.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+			decode = _decodeJdf
+			# The mark would otherwise hide the separator the first record starts with
+			if mm[:len(codecs.BOM_UTF8)] == codecs.BOM_UTF8:
+				mm.seek(len(codecs.BOM_UTF8))
+				decode = _decodeUtf8
+			countdown = _PROGRESS_INTERVAL
+			# Bound methods looked up once, rather than on every line
+			add = table.add
+			unimportablesAppend = table.unimportables.append
+			# Counted in locals, and stored on the table once the whole file has been read
+			lineCount = recordCount = unimportableCount = junkCount = 0
+			for line in iter(mm.readline, b""):
+				lineCount += 1
+				record = _tokenizeJdfLine(line, decode)
+				if record is None:
+					if not line.isspace():
+						junkCount += 1
+				elif record is _MALFORMED_RECORD:
+					if unimportableCount < _MAX_UNIMPORTABLES:
+						unimportablesAppend(decode(line, "replace")[0].rstrip())
+					unimportableCount += 1
+				else:
+					recordCount += 1
+					add(*record)
+				if onProgress is not None:
+					countdown -= 1
+					if not countdown:
+						countdown = _PROGRESS_INTERVAL
+						onProgress(mm.tell() * 100 // size)
+			table.lineCount = lineCount
+			table.recordCount = recordCount
+			table.unimportableCount = unimportableCount
+			table.junkCount = junkCount
+	log.debug(
+		"Read %d records from %d lines of the Jaws dictionary %s; %d were invalid records, and %d were not records.",
+		table.recordCount, table.lineCount, path, table.unimportableCount, table.junkCount
+	)
+	if table.duplicates:
+		log.debug("Replaced %d duplicate entries while reading the Jaws dictionary %s.", table.duplicates, path)
+	return table
+
+def jawsToRegex(pattern):
+	"""Converts a Jaws actual word containing wildcards into the equivalent regular expression."""
+	return pattern.translate(_JAWS_TO_RE_TABLE)
+
+def _newSpeechDictEntry(inWord, outWord, comment, caseSensitive):
+	"""Creates the NVDA speech dictionary entry for one Jaws dictionary record.
+	Plain words become whole word entries, and words with Jaws wildcards become regular expression entries.
+	"""
+	# Two substring tests, rather than a generator over the wildcards, since this runs for every entry
+	if "*" not in inWord and "?" not in inWord:
+		return speechDictHandler.SpeechDictEntry(
+			inWord, outWord, comment, caseSensitive, speechDictHandler.ENTRY_TYPE_WORD
+		)
+	# The replacement of a regular expression entry is a template, so backslashes in it must be doubled
+	return speechDictHandler.SpeechDictEntry(
+		r"\b" + jawsToRegex(inWord) + r"\b", outWord.replace("\\", "\\\\"), comment, caseSensitive,
+		speechDictHandler.ENTRY_TYPE_REGEXP
+	)
+
+def buildEntries(table, comment, onProgress=None):
+	"""Creates the NVDA speech dictionary entries for the records in a JdfTable, as returned by parseJawsDict.
+	comment is attached to every new entry.
+	Each entry compiles its pattern when it is created, which is most of the cost of an import,
+	so this is meant to run off the GUI thread.
+	If given, onProgress is called every few thousand entries with the percentage of them built so far.
+	"""
+	entries = []
+	append = entries.append
+	total = len(table)
+	rows = zip(table.inWords, table.outWords, table.caseSensitive)
+	for row, (inWord, outWord, caseSensitive) in enumerate(rows, 1):
+		append(_newSpeechDictEntry(inWord, outWord, comment, bool(caseSensitive)))
+		if onProgress is not None and not row % _PROGRESS_INTERVAL:
+			onProgress(row * 100 // total)
+	return entries
+
+def importEntries(entries, target):
+	"""Adds NVDA speech dictionary entries, as returned by buildEntries, to one of the NVDA speech dictionaries.
+	target is the key of an NVDA dictionary in speechDictHandler.dictionaries.
+	The entries are added as one batch, and the dictionary is saved once, after all of them are in.
+	"""
+	dic = speechDictHandler.dictionaries[target]
+	dic.extend(entries)
+	dic.save()
@@ -51,7 +51,7 @@ Start by selecting the "Import Jaws dictionary" entry from the NVDA Tools menu."
 # pythonSources = ["addon/globalPlugins/*.py"]
 # For more information on SCons Glob expressions please take a look at:
 # https://scons.org/doc/production/HTML/scons-user/apd.html
-pythonSources = ["addon/*.py", "addon/globalPlugins/*.py"]
+pythonSources = ["addon/*.py", "addon/globalPlugins/*.py", "addon/globalPlugins/*/*.py"]
 
 # Files that contain strings for translation. Usually your python sources
 i18nSources = pythonSources + ["buildVars.py"]